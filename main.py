@@ -5,6 +5,7 @@
 # dependencies = ["fastapi", "uvicorn[standard]", "pyyaml"]
 # ///
 
+import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +21,7 @@ BASE_DIR = Path("/home/erwin/obsidian/")
 DRAFTS_DIR = BASE_DIR / "0 - drafts"
 POOPS_DIR = BASE_DIR / "2 - prive" / "poops"
 WEBHOOK_DIR = BASE_DIR / "4 - webhook"
+IPHONE_TODOS_PATH = DRAFTS_DIR / "iphone-todos.md"
 
 
 app = FastAPI()
@@ -104,12 +106,17 @@ async def add_poop(entry: PoopEntry):
     base_filename = f"{now.year}-{now.month:02d}-{now.day:02d}"
     filepath = subdir / f"{base_filename}.md"
 
+    # Create the file exclusively; the open itself tells us whether it exists
     counter = 1
-    while filepath.exists():
-        filepath = subdir / f"{base_filename}-{counter}.md"
-        counter += 1
-
-    with filepath.open("w") as f:
+    while True:
+        try:
+            f = filepath.open("x")
+            break
+        except FileExistsError:
+            filepath = subdir / f"{base_filename}-{counter}.md"
+            counter += 1
+
+    with f:
         f.write("---\n")
         yaml.dump(data, f, default_flow_style=False)
         f.write("---\n")
@@ -118,16 +125,22 @@ async def add_poop(entry: PoopEntry):
     return {"status": "success", "message": f"Poop entry saved to {filepath}"}
 
 
+def _append_note(filepath: Path, content: str) -> None:
+    """Appends content as a todo item to the given note."""
+    with filepath.open("a") as f:
+        f.write("\n - [ ] " + content)
+
+
 @app.post("/note")
 async def add_note(request: Request):
     """Adds the request body to the daily note, avoiding duplicates."""
     body = await request.body()
     content_to_add = body.decode("utf-8")
 
-    today_filepath = DRAFTS_DIR / "iphone-todos.md"
+    today_filepath = IPHONE_TODOS_PATH
 
-    with today_filepath.open("a") as f:
-        f.write("\n - [ ] " + content_to_add)
+    # Run the file write in a worker thread so it doesn't block the event loop
+    await asyncio.to_thread(_append_note, today_filepath, content_to_add)
 
     print(f"Content added to iphone-todos.md: {today_filepath}")
     return {"status": "success", "message": f"Content added to {today_filepath}"}